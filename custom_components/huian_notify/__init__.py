@@ -1,11 +1,15 @@
 """Huian Notify integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
 import logging
+from datetime import timedelta
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.start import async_at_started
 
 from .const import (
     DOMAIN,
@@ -14,8 +18,12 @@ from .const import (
     CONF_REGISTRATION_ID,
     CONF_PRODUCTION,
     DEFAULT_PRODUCTION,
+    CONF_GATEWAY_URL,
+    HUIAN_TIMEOUT,
+    HUIAN_GATEWAY_TIMEOUT,
+    HUIAN_KEEPALIVE_INTERVAL,
 )
-from .notify import HuianNotificationService
+from .notify import HuianNotificationService, HuianTenant, resolve_api_url, tenant_key
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -25,9 +33,112 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
     # 注册 HTTP API 视图
     hass.http.register_view(HuianNotifyRegisterView)
     _LOGGER.info("✅ Huian Notify API endpoint registered at /api/huian_notify/register")
+
+    # 已有设备时提前建立到极光推送的连接，避免首条推送承担握手延迟
+    hass.data.setdefault(DOMAIN, {})
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        # 跳过已禁用的条目：它们不会 setup/unload，分区将无法释放
+        if entry.data.get("is_api_endpoint") or entry.disabled_by is not None:
+            continue
+        tenant = _get_tenant(hass, entry.data)
+        hass.async_add_executor_job(tenant.connection.warm_up)
+
+    # 启动完成后释放没有条目接管的分区（如条目 setup 失败），避免保活永不停止
+    async_at_started(hass, _async_prune_tenants)
+
     return True
 
 
+async def _async_prune_tenants(hass: HomeAssistant) -> None:
+    """Close partitions that no loaded entry uses."""
+    tenants = hass.data[DOMAIN].get("_tenants", {})
+    for key in [key for key, tenant in tenants.items() if not tenant.entry_ids]:
+        _async_close_tenant(hass, key)
+
+
+def _get_tenant(hass: HomeAssistant, entry_data: dict) -> HuianTenant:
+    """Return the push partition for an entry's app key, creating it if needed."""
+    tenants = hass.data[DOMAIN].setdefault("_tenants", {})
+    key = tenant_key(entry_data)
+    tenant = tenants.get(key)
+    if tenant is None:
+        app_key, api_url, _ = key
+        if any(k[:2] == (app_key, api_url) for k in tenants):
+            _LOGGER.warning(
+                "Entries for app_key %s use different master secrets; "
+                "each secret gets its own push partition",
+                app_key[-6:],
+            )
+        # 网关可能为排队/限流持有请求，客户端超时需覆盖网关的等待上限
+        tenant = HuianTenant(
+            entry_data["app_key"],
+            entry_data["master_secret"],
+            resolve_api_url(entry_data),
+            HUIAN_GATEWAY_TIMEOUT if entry_data.get(CONF_GATEWAY_URL) else HUIAN_TIMEOUT,
+        )
+        tenants[key] = tenant
+        _LOGGER.info(
+            "Created Huian push partition for app_key %s via %s",
+            tenant.app_key[-6:],
+            tenant.api_url,
+        )
+    return tenant
+
+
+def _async_start_keepalive(hass: HomeAssistant) -> None:
+    """Start periodic keep-alive for all partitions (once)."""
+    if "_keepalive_unsub" in hass.data[DOMAIN]:
+        return
+
+    async def _async_keepalive(now) -> None:
+        # 各分区并行保活，一个分区的连接故障不会阻塞其他分区
+        await asyncio.gather(
+            *(
+                hass.async_add_executor_job(tenant.connection.keep_alive)
+                for tenant in hass.data[DOMAIN].get("_tenants", {}).values()
+            )
+        )
+
+    hass.data[DOMAIN]["_keepalive_unsub"] = async_track_time_interval(
+        hass, _async_keepalive, timedelta(seconds=HUIAN_KEEPALIVE_INTERVAL)
+    )
+
+
+def _async_release_tenant(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Detach an entry from its partition; close the partition when unused."""
+    tenants = hass.data[DOMAIN].get("_tenants", {})
+    # 按 entry_id 查找：选项更新后 entry.data 可能已指向新的分区
+    key = next(
+        (key for key, tenant in tenants.items() if entry.entry_id in tenant.entry_ids),
+        None,
+    )
+    if key is None:
+        return
+
+    tenant = tenants[key]
+    tenant.entry_ids.discard(entry.entry_id)
+    if not tenant.entry_ids:
+        _async_close_tenant(hass, key)
+
+
+def _async_close_tenant(hass: HomeAssistant, key: tuple[str, str, str]) -> None:
+    """Close a partition; stop keep-alive when none are left."""
+    tenants = hass.data[DOMAIN].get("_tenants", {})
+    tenant = tenants.pop(key)
+    _LOGGER.info(
+        "Huian partition %s latency: %s",
+        tenant.app_key[-6:],
+        tenant.connection.latency_report(),
+    )
+    hass.async_add_executor_job(tenant.connection.close)
+
+    # 没有任何分区时停止保活
+    if not tenants:
+        unsub = hass.data[DOMAIN].pop("_keepalive_unsub", None)
+        if unsub is not None:
+            unsub()
+
+
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up Huian Notify from a config entry."""
     _LOGGER.info("Setting up Huian Notify integration")
@@ -47,11 +158,16 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         _LOGGER.info("API endpoint config entry loaded")
         return True
 
+    # 按 app_key 分区：预热连接并在有设备期间保持连接
+    tenant = _get_tenant(hass, entry.data)
+    tenant.entry_ids.add(entry.entry_id)
+    hass.async_add_executor_job(tenant.connection.warm_up)
+    _async_start_keepalive(hass)
+
     # 直接创建并注册notify服务（而不是通过平台转发）
     service = HuianNotificationService(
         hass,
-        entry.data["app_key"],
-        entry.data["master_secret"],
+        tenant,
         entry.data.get("registration_id"),
         entry.data.get("production", False),
     )
@@ -141,6 +257,9 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # 清理数据
     hass.data[DOMAIN].pop(entry.entry_id, None)
 
+    # 释放该设备占用的推送分区
+    _async_release_tenant(hass, entry)
+
     return True
 
 
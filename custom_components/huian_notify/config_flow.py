@@ -3,7 +3,9 @@ from __future__ import annotations
 
 import logging
 import base64
+import ipaddress
 from typing import Any
+from urllib.parse import urlparse
 
 import requests
 import voluptuous as vol
@@ -18,10 +20,12 @@ from .const import (
     HUIAN_MASTER_SECRET,
     CONF_REGISTRATION_ID,
     CONF_PRODUCTION,
+    CONF_GATEWAY_URL,
     DEFAULT_PRODUCTION,
     HUIAN_API_URL,
     HUIAN_TIMEOUT,
 )
+from .notify import normalize_gateway_url
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -239,8 +243,24 @@ class HuianConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         return HuianOptionsFlowHandler()
 
 
+def _is_cleartext_remote(gateway_url: str) -> bool:
+    """Return True for an http:// URL whose host is not loopback."""
+    parsed = urlparse(gateway_url)
+    if parsed.scheme != "http":
+        return False
+    host = parsed.hostname or ""
+    if host == "localhost":
+        return False
+    try:
+        return not ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return True
+
+
 class HuianOptionsFlowHandler(config_entries.OptionsFlow):
-    """Handle options flow - 允许用户切换生产/开发环境."""
+    """Handle options flow - 允许用户切换生产/开发环境及推送网关."""
+
+    _confirmed_gateway_url: str | None = None
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
@@ -251,16 +271,36 @@ class HuianOptionsFlowHandler(config_entries.OptionsFlow):
             # API 端点配置没有可配置的选项
             return self.async_abort(reason="no_options_available")
         
+        errors = {}
+
         if user_input is not None:
-            # 更新配置（保留原有的app_key和master_secret）
-            new_data = dict(self.config_entry.data)
-            new_data[CONF_PRODUCTION] = user_input[CONF_PRODUCTION]
-            
-            self.hass.config_entries.async_update_entry(
-                self.config_entry,
-                data=new_data,
-            )
-            return self.async_create_entry(title="", data={})
+            # 网关地址留空表示直连极光推送
+            gateway_url = normalize_gateway_url(user_input.get(CONF_GATEWAY_URL, ""))
+            if gateway_url and not gateway_url.startswith(("http://", "https://")):
+                errors[CONF_GATEWAY_URL] = "invalid_gateway_url"
+            elif (
+                _is_cleartext_remote(gateway_url)
+                and gateway_url != self._confirmed_gateway_url
+            ):
+                # 明文 HTTP 会在局域网中暴露凭据：先提示一次，再次提交相同地址即确认
+                _LOGGER.warning(
+                    "Gateway URL %s is not loopback and uses plain HTTP; "
+                    "push credentials will be sent in cleartext",
+                    gateway_url,
+                )
+                self._confirmed_gateway_url = gateway_url
+                errors[CONF_GATEWAY_URL] = "insecure_gateway_url"
+            else:
+                # 更新配置（保留原有的app_key和master_secret）
+                new_data = dict(self.config_entry.data)
+                new_data[CONF_PRODUCTION] = user_input[CONF_PRODUCTION]
+                new_data[CONF_GATEWAY_URL] = gateway_url
+                
+                self.hass.config_entries.async_update_entry(
+                    self.config_entry,
+                    data=new_data,
+                )
+                return self.async_create_entry(title="", data={})
 
         # 显示当前配置
         return self.async_show_form(
@@ -273,6 +313,11 @@ class HuianOptionsFlowHandler(config_entries.OptionsFlow):
                             CONF_PRODUCTION, DEFAULT_PRODUCTION
                         ),
                     ): bool,
+                    vol.Optional(
+                        CONF_GATEWAY_URL,
+                        default=self.config_entry.data.get(CONF_GATEWAY_URL, ""),
+                    ): str,
                 }
             ),
+            errors=errors,
         )
@@ -9,6 +9,7 @@ HUIAN_MASTER_SECRET = "6f6fb742770bdbcfe72fbeb3"
 # 用户配置项（每个设备不同）
 CONF_REGISTRATION_ID = "registration_id"
 CONF_PRODUCTION = "production"
+CONF_GATEWAY_URL = "gateway_url"  # 可选：经由推送网关转发，而不是直连极光
 
 # 默认值
 DEFAULT_NAME = "Huian"
@@ -18,3 +19,31 @@ DEFAULT_PRODUCTION = True  # 生产环境（可在 HA 配置中切换）
 HUIAN_API_URL = "https://api.jpush.cn/v3/push"
 HUIAN_TIMEOUT = 10
 
+
+# 连接预热与保活
+HUIAN_POOL_MAXSIZE = 4  # 连接池大小
+HUIAN_KEEPALIVE_INTERVAL = 30  # 保活间隔（秒），有设备时定期轻量请求保持连接
+HUIAN_IDLE_TIMEOUT = 60  # 最近该时间（秒）内用过连接时跳过预热（冷/热按是否新建 socket 判断）
+
+# 按 app_key 隔离的推送分区（每个分区独立的连接池、限流、队列和并发）
+HUIAN_TENANT_CONCURRENCY = HUIAN_POOL_MAXSIZE  # 每个分区同时进行的请求数
+HUIAN_TENANT_RATE_LIMIT = 10  # 每个分区每秒最多推送数
+HUIAN_TENANT_QUEUE_SIZE = 100  # 每个分区最多排队的推送数，超出直接丢弃
+HUIAN_TENANT_THROTTLE_DEFAULT = 60  # 收到 429 且无重置时间时的暂停时长（秒）
+HUIAN_TENANT_SEND_DEADLINE = 5  # notify 服务调用排队/限流最多等待（秒），超时放弃本条推送
+
+# 推送网关（python -m custom_components.huian_notify.gateway）
+HUIAN_GATEWAY_PORT = 8765
+HUIAN_GATEWAY_BATCH_WINDOW = 0.05  # 合并相同内容推送的等待时间（秒）
+HUIAN_GATEWAY_BATCH_MAX = 1000  # 极光单次推送最多 1000 个 registration_id
+HUIAN_GATEWAY_DEADLINE = 5  # 网关排队/限流最多等待（秒），超时返回 429 而不是继续等待
+# 经由网关发送时的客户端超时：覆盖网关等待上限 + 上游请求超时
+HUIAN_GATEWAY_TIMEOUT = HUIAN_GATEWAY_DEADLINE + HUIAN_TIMEOUT + 5
+
+# 推送前校验（services.yaml 中 data 支持的字段）
+HUIAN_ALLOWED_DATA_KEYS = ("badge", "sound")
+HUIAN_BADGE_MAX = 99999
+HUIAN_SOUND_EXTENSIONS = (".caf", ".aiff", ".wav")
+HUIAN_APNS_PAYLOAD_LIMIT = 4096  # APNs 单条推送 payload 上限（字节）
+HUIAN_APNS_PAYLOAD_RESERVED = 256  # 预留给极光附加字段（_j_msgid 等）
+HUIAN_TRUNCATION_MARK = "…"
@@ -0,0 +1,37 @@
+"""Diagnostics support for Huian Notify."""
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN, CONF_REGISTRATION_ID
+
+TO_REDACT = {"master_secret", CONF_REGISTRATION_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    tenants = hass.data.get(DOMAIN, {}).get("_tenants", {})
+
+    # API 端点配置显示所有分区，设备配置只显示自己所在的分区
+    if entry.data.get("is_api_endpoint"):
+        partitions = [tenant.diagnostics() for tenant in tenants.values()]
+    else:
+        partitions = [
+            tenant.diagnostics()
+            for tenant in tenants.values()
+            if entry.entry_id in tenant.entry_ids
+        ]
+
+    return {
+        "entry": async_redact_data(dict(entry.data), TO_REDACT),
+        "service_name": hass.data.get(DOMAIN, {}).get(
+            f"{entry.entry_id}_service_name"
+        ),
+        "partitions": partitions,
+    }
@@ -0,0 +1,416 @@
+"""Standalone Huian push gateway shared by multiple Home Assistant instances.
+
+运行方式（需在装有 Home Assistant 的 Python 环境中，从配置目录执行）::
+
+    python -m custom_components.huian_notify.gateway --port 8765
+
+默认只监听本机回环地址；对局域网开放时请配合 ``--ssl-cert/--ssl-key`` 使用
+HTTPS，否则转发请求中的 app_key:master_secret 会以明文传输。
+
+网关对外提供与极光推送兼容的 ``POST /v3/push`` 接口，复用 notify.py 中的
+连接与分区（HuianTenant）代码，对所有实例的推送统一排队、限流，并将
+内容相同的推送合并为一次请求。``--api-url`` 可指向本地的极光替身服务，
+用于端到端测试。
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import base64
+import binascii
+import ipaddress
+import json
+import logging
+import math
+import ssl
+import time
+from typing import Any
+
+import requests
+from aiohttp import web
+
+from .const import (
+    HUIAN_API_URL,
+    HUIAN_KEEPALIVE_INTERVAL,
+    HUIAN_GATEWAY_PORT,
+    HUIAN_GATEWAY_BATCH_WINDOW,
+    HUIAN_GATEWAY_BATCH_MAX,
+    HUIAN_GATEWAY_DEADLINE,
+)
+from .notify import HuianRateLimited, HuianTenant
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class _Batch:
+    """等待合并发送的一批推送."""
+
+    def __init__(
+        self, tenant: HuianTenant, payload: dict[str, Any], deadline: float
+    ) -> None:
+        """Initialize the batch."""
+        self.tenant = tenant
+        self.payload = payload
+        self.deadline = deadline
+        self.registration_ids: list[str] = []
+        self.size = 0
+        self.future: asyncio.Future = asyncio.get_running_loop().create_future()
+        self.timer: asyncio.TimerHandle | None = None
+
+
+class HuianGateway:
+    """Push gateway: one partition per credential, shared by all clients."""
+
+    def __init__(
+        self,
+        api_url: str = HUIAN_API_URL,
+        batch_window: float = HUIAN_GATEWAY_BATCH_WINDOW,
+        deadline: float = HUIAN_GATEWAY_DEADLINE,
+    ) -> None:
+        """Initialize the gateway."""
+        self._api_url = api_url
+        self._batch_window = batch_window
+        self._deadline = deadline
+        # 按完整认证头分区：凭据由上游极光校验，错误的密钥只会得到自己的 401
+        self._tenants: dict[str, HuianTenant] = {}
+        self._batches: dict[tuple[str, str], _Batch] = {}
+        self._tasks: set[asyncio.Task] = set()
+        self._keepalive_task: asyncio.Task | None = None
+        self._metrics = {"requests": 0, "batches": 0}
+
+    def create_app(self) -> web.Application:
+        """Create the aiohttp application."""
+        app = web.Application()
+        app.router.add_post("/v3/push", self._handle_push)
+        app.router.add_get("/health", self._handle_health)
+        app.on_startup.append(self._async_on_startup)
+        app.on_cleanup.append(self._async_on_cleanup)
+        return app
+
+    def _get_tenant(self, authorization: str) -> HuianTenant | None:
+        """按 Basic 认证头返回分区；认证头格式无效时返回 None."""
+        scheme, _, encoded = authorization.partition(" ")
+        if scheme != "Basic":
+            return None
+        try:
+            credentials = base64.b64decode(encoded, validate=True).decode()
+        except (binascii.Error, UnicodeDecodeError):
+            return None
+        app_key, _, master_secret = credentials.partition(":")
+        if not app_key or not master_secret:
+            return None
+
+        tenant = self._tenants.get(authorization)
+        if tenant is None:
+            tenant = HuianTenant(app_key, master_secret, self._api_url)
+            self._tenants[authorization] = tenant
+            self._spawn(self._async_run_job(tenant.connection.warm_up))
+            _LOGGER.info("Created push partition for app_key %s", app_key[-6:])
+        return tenant
+
+    def _drop_tenant(self, tenant: HuianTenant) -> None:
+        """上游拒绝凭据（401）后移除该分区，避免无效凭据长期占用资源."""
+        if self._tenants.get(tenant.authorization) is not tenant:
+            return
+        self._tenants.pop(tenant.authorization)
+        self._spawn(self._async_run_job(tenant.connection.close))
+        _LOGGER.warning(
+            "Upstream rejected credentials for app_key %s, partition removed",
+            tenant.app_key[-6:],
+        )
+
+    @staticmethod
+    def _batch_key(payload: dict[str, Any]) -> str | None:
+        """返回可合并推送的分组键；无法合并时返回 None."""
+        audience = payload.get("audience")
+        if (
+            not isinstance(audience, dict)
+            or list(audience) != ["registration_id"]
+            or not isinstance(audience["registration_id"], list)
+            or "cid" in payload
+        ):
+            return None
+        rest = {key: value for key, value in payload.items() if key != "audience"}
+        return json.dumps(rest, sort_keys=True, ensure_ascii=False)
+
+    async def _handle_push(self, request: web.Request) -> web.Response:
+        """Handle a JPush-compatible push request."""
+        tenant = self._get_tenant(request.headers.get("Authorization", ""))
+        if tenant is None:
+            return _error_response(401, 1004, "Invalid authorization")
+
+        try:
+            payload = await request.json()
+        except ValueError:
+            return _error_response(400, 1003, "Invalid JSON")
+        if not isinstance(payload, dict):
+            return _error_response(400, 1003, "Payload must be an object")
+
+        self._metrics["requests"] += 1
+        # 网关持有请求的上限，超过后返回 429，避免客户端超时后推送仍被延迟发出
+        deadline = time.monotonic() + self._deadline
+        key = self._batch_key(payload)
+        if key is None:
+            status, body, headers = await self._async_send(tenant, payload, deadline)
+            batch_size = 1
+        else:
+            (status, body, headers), batch_size = await self._async_enqueue(
+                tenant, key, payload, deadline
+            )
+
+        return web.json_response(
+            body,
+            status=status,
+            headers={**headers, "X-Huian-Batch-Size": str(batch_size)},
+        )
+
+    async def _handle_health(self, request: web.Request) -> web.Response:
+        """Return gateway and partition state."""
+        return web.json_response(
+            {
+                **self._metrics,
+                "pending_batches": len(self._batches),
+                "partitions": [
+                    tenant.diagnostics() for tenant in self._tenants.values()
+                ],
+            }
+        )
+
+    async def _async_enqueue(
+        self,
+        tenant: HuianTenant,
+        key: str,
+        payload: dict[str, Any],
+        deadline: float,
+    ) -> tuple[tuple[int, dict[str, Any], dict[str, str]], int]:
+        """把推送加入同内容批次，等待批次发送结果."""
+        batch_key = (tenant.authorization, key)
+        registration_ids = payload["audience"]["registration_id"]
+
+        batch = self._batches.get(batch_key)
+        if (
+            batch is not None
+            and len(batch.registration_ids) + len(registration_ids)
+            > HUIAN_GATEWAY_BATCH_MAX
+        ):
+            self._flush(batch_key)
+            batch = None
+        if batch is None:
+            # 批次中第一条请求的截止时间最早，以它为准
+            batch = _Batch(tenant, payload, deadline)
+            batch.timer = asyncio.get_running_loop().call_later(
+                self._batch_window, self._flush, batch_key
+            )
+            self._batches[batch_key] = batch
+
+        batch.registration_ids.extend(registration_ids)
+        batch.size += 1
+        result = await asyncio.shield(batch.future)
+        return result, batch.size
+
+    def _flush(self, batch_key: tuple[str, str]) -> None:
+        """Send a pending batch."""
+        batch = self._batches.pop(batch_key, None)
+        if batch is None:
+            return
+        if batch.timer is not None:
+            batch.timer.cancel()
+        self._spawn(self._async_send_batch(batch))
+
+    async def _async_send_batch(self, batch: _Batch) -> None:
+        """Send a batch and resolve every waiting request."""
+        payload = dict(batch.payload)
+        payload["audience"] = {
+            "registration_id": list(dict.fromkeys(batch.registration_ids))
+        }
+        self._metrics["batches"] += 1
+        try:
+            result = await self._async_send(batch.tenant, payload, batch.deadline)
+        except Exception as err:  # pylint: disable=broad-except
+            _LOGGER.exception("Unexpected error sending batch: %s", err)
+            result = (500, {"error": {"code": 1000, "message": str(err)}}, {})
+        batch.future.set_result(result)
+
+    async def _async_send(
+        self, tenant: HuianTenant, payload: dict[str, Any], deadline: float
+    ) -> tuple[int, dict[str, Any], dict[str, str]]:
+        """Send through the partition; return (status, JSON body, headers)."""
+        try:
+            result = await tenant.async_send(payload, deadline)
+        except HuianRateLimited as err:
+            return (
+                429,
+                {"error": {"code": 2002, "message": "Gateway rate limit, retry later"}},
+                {
+                    "X-Rate-Limit-Remaining": "0",
+                    "X-Rate-Limit-Reset": str(math.ceil(err.retry_after)),
+                },
+            )
+        except requests.exceptions.RequestException as err:
+            _LOGGER.error("Error forwarding push to %s: %s", self._api_url, err)
+            return (
+                502,
+                {"error": {"code": 1000, "message": f"Upstream error: {err}"}},
+                {},
+            )
+
+        if result is None:
+            return 503, {"error": {"code": 2002, "message": "Gateway queue full"}}, {}
+
+        response, elapsed_ms, warm = result
+        if response.status_code == 401:
+            self._drop_tenant(tenant)
+        _LOGGER.debug(
+            "Forwarded push: status=%s (%s, %.0f ms)",
+            response.status_code,
+            "warm" if warm else "cold",
+            elapsed_ms,
+        )
+        try:
+            body = response.json()
+        except ValueError:
+            body = {"error": {"code": response.status_code, "message": response.text}}
+        # 透传极光的限流头，客户端据此暂停自己的分区
+        headers = {
+            name: value
+            for name, value in response.headers.items()
+            if name.lower().startswith("x-rate-limit-")
+        }
+        return response.status_code, body, headers
+
+    def _spawn(self, coro) -> None:
+        """Run a background task, keeping a reference until it is done."""
+        task = asyncio.get_running_loop().create_task(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    @staticmethod
+    async def _async_run_job(func) -> None:
+        """Run a blocking call in the default executor."""
+        await asyncio.get_running_loop().run_in_executor(None, func)
+
+    async def _async_keepalive(self) -> None:
+        """Periodically keep all partition connections warm."""
+        while True:
+            await asyncio.sleep(HUIAN_KEEPALIVE_INTERVAL)
+            await asyncio.gather(
+                *(
+                    self._async_run_job(tenant.connection.keep_alive)
+                    for tenant in list(self._tenants.values())
+                )
+            )
+
+    async def _async_on_startup(self, app: web.Application) -> None:
+        """Start background keep-alive."""
+        self._keepalive_task = asyncio.get_running_loop().create_task(
+            self._async_keepalive()
+        )
+
+    async def _async_on_cleanup(self, app: web.Application) -> None:
+        """Flush pending batches and close connections."""
+        if self._keepalive_task is not None:
+            self._keepalive_task.cancel()
+        for batch_key in list(self._batches):
+            self._flush(batch_key)
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        for tenant in self._tenants.values():
+            _LOGGER.info(
+                "Partition %s: %s", tenant.app_key[-6:], tenant.diagnostics()
+            )
+            tenant.connection.close()
+
+
+def _error_response(status: int, code: int, message: str) -> web.Response:
+    """Return an error in JPush's response format."""
+    return web.json_response(
+        {"error": {"code": code, "message": message}}, status=status
+    )
+
+
+def _is_loopback(host: str) -> bool:
+    """Return True if host is a loopback name or address."""
+    if host == "localhost":
+        return True
+    try:
+        return ipaddress.ip_address(host).is_loopback
+    except ValueError:
+        return False
+
+
+async def _async_serve(args: argparse.Namespace) -> None:
+    """Run the gateway until cancelled."""
+    gateway = HuianGateway(args.api_url, args.batch_window, args.deadline)
+    runner = web.AppRunner(gateway.create_app())
+    await runner.setup()
+
+    ssl_context = None
+    if args.ssl_cert:
+        ssl_context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+        ssl_context.load_cert_chain(args.ssl_cert, args.ssl_key)
+    elif not _is_loopback(args.host):
+        # 转发的请求带有 app_key:master_secret 认证头，明文 HTTP 会在局域网中暴露凭据
+        _LOGGER.warning(
+            "Listening on %s without TLS: credentials are sent in cleartext, "
+            "use --ssl-cert/--ssl-key",
+            args.host,
+        )
+
+    sites: list[web.BaseSite] = [
+        web.TCPSite(runner, args.host, args.port, ssl_context=ssl_context)
+    ]
+    if args.unix_socket:
+        sites.append(web.UnixSite(runner, args.unix_socket))
+    for site in sites:
+        await site.start()
+        _LOGGER.info("Huian push gateway listening on %s", site.name)
+
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await runner.cleanup()
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(description="Huian push gateway")
+    parser.add_argument("--host", default="127.0.0.1", help="HTTP listen address")
+    parser.add_argument(
+        "--port", type=int, default=HUIAN_GATEWAY_PORT, help="HTTP listen port"
+    )
+    parser.add_argument("--unix-socket", help="also listen on this Unix socket path")
+    parser.add_argument("--ssl-cert", help="serve HTTPS with this certificate (PEM)")
+    parser.add_argument("--ssl-key", help="private key for --ssl-cert (PEM)")
+    parser.add_argument(
+        "--api-url",
+        default=HUIAN_API_URL,
+        help="upstream push endpoint (point at a local JPush stand-in for testing)",
+    )
+    parser.add_argument(
+        "--batch-window",
+        type=float,
+        default=HUIAN_GATEWAY_BATCH_WINDOW,
+        help="seconds to wait for identical pushes to merge",
+    )
+    parser.add_argument(
+        "--deadline",
+        type=float,
+        default=HUIAN_GATEWAY_DEADLINE,
+        help="max seconds to hold a push for queueing/rate limits before 429",
+    )
+    parser.add_argument("--log-level", default="INFO")
+    args = parser.parse_args(argv)
+    if args.ssl_key and not args.ssl_cert:
+        parser.error("--ssl-key requires --ssl-cert")
+
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format="%(asctime)s %(levelname)s %(name)s: %(message)s",
+    )
+    try:
+        asyncio.run(_async_serve(args))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
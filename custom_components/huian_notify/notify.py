@@ -1,11 +1,19 @@
 """Huian notification service."""
 from __future__ import annotations
 
+import asyncio
+import json
+import hashlib
 import logging
 import base64
+import re
+import threading
+import time
+import unicodedata
 from typing import Any
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from homeassistant.components.notify import (
     ATTR_TITLE,
@@ -14,19 +22,39 @@ from homeassistant.components.notify import (
 )
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import ServiceValidationError
 from homeassistant.helpers.typing import ConfigType, DiscoveryInfoType
 
 from .const import (
     DOMAIN,
     CONF_REGISTRATION_ID,
     CONF_PRODUCTION,
+    CONF_GATEWAY_URL,
     DEFAULT_PRODUCTION,
     HUIAN_API_URL,
     HUIAN_TIMEOUT,
+    HUIAN_POOL_MAXSIZE,
+    HUIAN_KEEPALIVE_INTERVAL,
+    HUIAN_IDLE_TIMEOUT,
+    HUIAN_TENANT_CONCURRENCY,
+    HUIAN_TENANT_RATE_LIMIT,
+    HUIAN_TENANT_QUEUE_SIZE,
+    HUIAN_TENANT_THROTTLE_DEFAULT,
+    HUIAN_TENANT_SEND_DEADLINE,
+    HUIAN_ALLOWED_DATA_KEYS,
+    HUIAN_BADGE_MAX,
+    HUIAN_SOUND_EXTENSIONS,
+    HUIAN_APNS_PAYLOAD_LIMIT,
+    HUIAN_APNS_PAYLOAD_RESERVED,
+    HUIAN_TRUNCATION_MARK,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_BADGE_PATTERN = re.compile(r"^([+-]?)([0-9]+)$")
+
+_ZWJ = "\u200d"
+
 
 async def async_get_service(
     hass: HomeAssistant,
@@ -49,38 +77,564 @@ async def async_get_service(
         _LOGGER.error("No entry data found for entry_id: %s", entry_id)
         return None
 
+    # 推送分区由 async_setup_entry 创建和释放，这里不单独创建
+    tenant = hass.data[DOMAIN].get("_tenants", {}).get(tenant_key(entry_data))
+    if tenant is None:
+        _LOGGER.error("No push partition found for entry_id: %s", entry_id)
+        return None
+
     return HuianNotificationService(
         hass,
-        entry_data["app_key"],
-        entry_data["master_secret"],
+        tenant,
         entry_data[CONF_REGISTRATION_ID],
         entry_data.get(CONF_PRODUCTION, DEFAULT_PRODUCTION),
     )
 
 
+def normalize_gateway_url(gateway_url: str) -> str:
+    """Return the gateway base URL, dropping a trailing slash or /v3/push."""
+    gateway_url = gateway_url.strip().rstrip("/")
+    if gateway_url.endswith("/v3/push"):
+        gateway_url = gateway_url[: -len("/v3/push")]
+    return gateway_url
+
+
+def resolve_api_url(entry_data: dict[str, Any]) -> str:
+    """Return the push endpoint: the gateway if configured, else JPush."""
+    gateway_url = entry_data.get(CONF_GATEWAY_URL)
+    if gateway_url:
+        return f"{normalize_gateway_url(gateway_url)}/v3/push"
+    return HUIAN_API_URL
+
+
+def tenant_key(entry_data: dict[str, Any]) -> tuple[str, str, str]:
+    """Return the push partition key for a config entry.
+
+    同一 app_key 使用不同 master_secret（如密钥轮换）时分属不同分区，
+    各自用自己的凭据发送。
+    """
+    secret_hash = hashlib.sha256(entry_data["master_secret"].encode()).hexdigest()
+    return entry_data["app_key"], resolve_api_url(entry_data), secret_hash[:12]
+
+
+def build_payload(
+    registration_ids: list[str],
+    title: str,
+    message: str,
+    badge: str | int,
+    sound: str,
+    production: bool,
+) -> dict[str, Any]:
+    """构建极光推送 payload."""
+    return {
+        "platform": ["ios"],
+        "audience": {"registration_id": registration_ids},
+        "notification": {
+            "ios": {
+                "alert": {"title": title, "body": message},
+                "badge": badge,
+                "sound": sound,
+            }
+        },
+        "options": {"apns_production": production},
+    }
+
+
+def _validate_badge(badge: Any) -> str | int:
+    """Validate badge: an absolute count (5, "5") or a delta ("+1", "-1")."""
+    if isinstance(badge, int) and not isinstance(badge, bool):
+        if not 0 <= badge <= HUIAN_BADGE_MAX:
+            raise ServiceValidationError(
+                f"Invalid badge {badge!r}: must be between 0 and {HUIAN_BADGE_MAX}"
+            )
+        return badge
+
+    match = _BADGE_PATTERN.match(badge.strip()) if isinstance(badge, str) else None
+    if match is None:
+        raise ServiceValidationError(
+            f"Invalid badge {badge!r}: use a number like \"5\" or a delta like \"+1\""
+        )
+    sign, digits = match.groups()
+    if int(digits) > HUIAN_BADGE_MAX:
+        raise ServiceValidationError(
+            f"Invalid badge {badge!r}: must be between 0 and {HUIAN_BADGE_MAX}"
+        )
+    # 规范化为 "+1" / "5" 形式（去掉前导零，保留符号）
+    return f"{sign}{int(digits)}"
+
+
+def _validate_sound(sound: Any) -> str:
+    """Validate sound: "default" or a bundled .caf/.aiff/.wav file name."""
+    if not isinstance(sound, str) or not sound.strip():
+        raise ServiceValidationError(
+            f"Invalid sound {sound!r}: must be a file name"
+        )
+    sound = sound.strip()
+    if sound != "default" and (
+        "/" in sound or not sound.lower().endswith(HUIAN_SOUND_EXTENSIONS)
+    ):
+        raise ServiceValidationError(
+            f"Invalid sound {sound!r}: use \"default\" or a "
+            f"{'/'.join(HUIAN_SOUND_EXTENSIONS)} file bundled with the app"
+        )
+    return sound
+
+
+def _is_regional_indicator(char: str) -> bool:
+    """Return True for a flag-emoji regional indicator letter."""
+    return "\U0001f1e6" <= char <= "\U0001f1ff"
+
+
+def _attaches_to_previous(char: str) -> bool:
+    """Return True if char extends the preceding grapheme (ZWJ, VS, modifier...)."""
+    return (
+        char == _ZWJ
+        or "\U0001f3fb" <= char <= "\U0001f3ff"  # 肤色修饰符
+        or "\U000e0020" <= char <= "\U000e007f"  # 旗帜标签字符
+        or unicodedata.category(char) in ("Mn", "Mc", "Me")  # 组合符、变体选择符
+    )
+
+
+def _grapheme_boundary(text: str, index: int) -> int:
+    """把截断位置回退到字形边界：不拆开 ZWJ 序列、修饰符或国旗的两个字母."""
+    while 0 < index < len(text) and (
+        _attaches_to_previous(text[index]) or text[index - 1] == _ZWJ
+    ):
+        index -= 1
+
+    if 0 < index < len(text) and _is_regional_indicator(text[index]):
+        # 国旗由两个区域指示符组成，从连续序列开头两两配对
+        start = index
+        while start > 0 and _is_regional_indicator(text[start - 1]):
+            start -= 1
+        if (index - start) % 2:
+            index -= 1
+    return index
+
+
+def _truncate_utf8(text: str, max_bytes: int) -> str:
+    """按 UTF-8 字节截断，并回退到字形边界，不拆分中文或 emoji."""
+    cut = text.encode()[:max_bytes].decode("utf-8", "ignore")
+    return text[: _grapheme_boundary(text, len(cut))]
+
+
+def _check_encodable(field: str, value: str) -> None:
+    """Reject text that cannot be UTF-8 encoded (e.g. lone surrogates)."""
+    try:
+        value.encode()
+    except UnicodeEncodeError as err:
+        raise ServiceValidationError(
+            f"Invalid {field}: contains characters that cannot be encoded as UTF-8"
+        ) from err
+
+
+def _escaped_size(text: str) -> int:
+    """Return the UTF-8 size of text once JSON-escaped (without quotes)."""
+    return len(json.dumps(text, ensure_ascii=False).encode()) - 2
+
+
+def prepare_notification(
+    title: Any, message: Any, data: dict[str, Any] | None
+) -> tuple[str, str, str | int, str]:
+    """推送前校验并规范化参数，超出 APNs 字节预算时截断正文.
+
+    校验失败抛出 ServiceValidationError，不会产生任何网络请求。
+    返回 (title, message, badge, sound)。
+    """
+    if data is None:
+        data = {}
+    if not isinstance(data, dict):
+        raise ServiceValidationError("Invalid data: must be an object")
+    unknown = sorted(set(data) - set(HUIAN_ALLOWED_DATA_KEYS))
+    if unknown:
+        raise ServiceValidationError(
+            f"Unsupported data keys: {', '.join(map(str, unknown))} "
+            f"(allowed: {', '.join(HUIAN_ALLOWED_DATA_KEYS)})"
+        )
+
+    title = "" if title is None else str(title)
+    message = "" if message is None else str(message)
+    badge = _validate_badge(data.get("badge", "+1"))
+    sound = _validate_sound(data.get("sound", "default"))
+    for field, value in (("title", title), ("message", message), ("sound", sound)):
+        _check_encodable(field, value)
+
+    # 按设备实际收到的 aps 结构计算一次 UTF-8 编码大小
+    aps = {
+        "aps": {
+            "alert": {"title": title, "body": message},
+            "badge": badge,
+            "sound": sound,
+        }
+    }
+    size = len(json.dumps(aps, ensure_ascii=False, separators=(",", ":")).encode())
+    budget = HUIAN_APNS_PAYLOAD_LIMIT - HUIAN_APNS_PAYLOAD_RESERVED
+    if size <= budget:
+        return title, message, badge, sound
+
+    # 正文以外（标题、角标、铃声及结构）占用的字节，正文只能使用剩余预算
+    mark_bytes = _escaped_size(HUIAN_TRUNCATION_MARK)
+    max_body_bytes = budget - (size - _escaped_size(message))
+    if max_body_bytes < mark_bytes:
+        raise ServiceValidationError(
+            f"Notification title is too long: title, badge and sound need "
+            f"{size - _escaped_size(message) + mark_bytes} bytes, "
+            f"limit is {budget} bytes"
+        )
+
+    # 二分查找能放下的最长前缀：逐个测量候选正文转义后的实际大小，
+    # 转义后大小不小于原文字节数，所以原文字节上限即为查找上界
+    low, high = 0, max_body_bytes - mark_bytes
+    while low < high:
+        mid = (low + high + 1) // 2
+        candidate = _truncate_utf8(message, mid) + HUIAN_TRUNCATION_MARK
+        if _escaped_size(candidate) <= max_body_bytes:
+            low = mid
+        else:
+            high = mid - 1
+    truncated = _truncate_utf8(message, low) + HUIAN_TRUNCATION_MARK
+
+    body_bytes = len(message.encode())
+    _LOGGER.warning(
+        "Huian notification body truncated from %d to %d bytes to fit the %d byte payload limit",
+        body_bytes,
+        len(truncated.encode()),
+        budget,
+    )
+    return title, truncated, badge, sound
+
+
+class HuianConnection:
+    """到极光推送 API 的共享长连接.
+
+    复用同一个 requests.Session，使 DNS 解析、TCP 连接和 TLS 握手只在
+    冷启动时发生一次；通过 warm_up/keep_alive 提前建立并维持连接，
+    同时统计冷/热路径的推送延迟。所有方法都是阻塞的，需在 executor 中调用。
+    """
+
+    def __init__(
+        self, api_url: str = HUIAN_API_URL, timeout: float = HUIAN_TIMEOUT
+    ) -> None:
+        """Initialize the connection."""
+        self._api_url = api_url
+        self._timeout = timeout
+        self._session = requests.Session()
+        self._adapter = HTTPAdapter(
+            pool_connections=1, pool_maxsize=HUIAN_POOL_MAXSIZE
+        )
+        self._session.mount("https://", self._adapter)
+        self._session.mount("http://", self._adapter)
+        self._lock = threading.Lock()
+        self._last_used: float | None = None
+        self._warming = False
+        self._warm_up_ms: float | None = None
+        self._latency = {
+            "cold": {"count": 0, "total_ms": 0.0},
+            "warm": {"count": 0, "total_ms": 0.0},
+        }
+
+    @property
+    def recently_used(self) -> bool:
+        """Return True if the connection was used within the idle timeout."""
+        last_used = self._last_used
+        return (
+            last_used is not None
+            and time.monotonic() - last_used < HUIAN_IDLE_TIMEOUT
+        )
+
+    def _opened_connections(self) -> int:
+        """Return how many sockets urllib3 has opened so far."""
+        pools = self._adapter.poolmanager.pools
+        total = 0
+        for key in pools.keys():
+            pool = pools.get(key)
+            if pool is not None:
+                total += pool.num_connections
+        return total
+
+    def _ping(self) -> float | None:
+        """发送轻量 HEAD 请求以建立/保持连接，返回耗时（毫秒）."""
+        start = time.monotonic()
+        try:
+            # 只关心连接本身，返回状态码无意义（通常为 405）
+            self._session.head(self._api_url, timeout=self._timeout)
+        except requests.exceptions.RequestException as err:
+            _LOGGER.debug("Huian connection ping failed: %s", err)
+            return None
+        end = time.monotonic()
+        self._last_used = end
+        return (end - start) * 1000
+
+    def warm_up(self) -> None:
+        """预先解析域名并建立 TLS 连接."""
+        # 预热进行中时直接返回，避免并发的预热各自新建一个 socket
+        with self._lock:
+            if self._warming or self.recently_used:
+                return
+            self._warming = True
+        try:
+            elapsed_ms = self._ping()
+        finally:
+            self._warming = False
+        if elapsed_ms is not None:
+            self._warm_up_ms = elapsed_ms
+            _LOGGER.info("Huian connection warmed up in %.0f ms", elapsed_ms)
+
+    def keep_alive(self) -> None:
+        """保活：最近半个保活周期内没有任何请求时发送 ping."""
+        last_used = self._last_used
+        # 以半个周期为阈值：定时器与上次 ping 的间隔略小于一个周期，
+        # 若以整周期为阈值会每隔一次才真正 ping，空闲连接实际 60 秒才保活一次
+        if (
+            last_used is not None
+            and time.monotonic() - last_used < HUIAN_KEEPALIVE_INTERVAL / 2
+        ):
+            return
+        self._ping()
+
+    def post(
+        self, payload: dict[str, Any], headers: dict[str, str]
+    ) -> tuple[requests.Response, float, bool]:
+        """发送推送请求，返回 (response, 耗时毫秒, 是否复用了已有连接).
+
+        冷/热按 urllib3 是否新建了 socket 判断；并发请求时标记可能互换，
+        统计上仍能反映冷启动与复用连接的延迟差异。
+        """
+        opened = self._opened_connections()
+        start = time.monotonic()
+        response = self._session.post(
+            self._api_url,
+            json=payload,
+            headers=headers,
+            timeout=self._timeout,
+        )
+        end = time.monotonic()
+        self._last_used = end
+        elapsed_ms = (end - start) * 1000
+        warm = self._opened_connections() == opened
+
+        with self._lock:
+            bucket = self._latency["warm" if warm else "cold"]
+            bucket["count"] += 1
+            bucket["total_ms"] += elapsed_ms
+
+        return response, elapsed_ms, warm
+
+    def latency_report(self) -> dict[str, Any]:
+        """Return cold-path versus warm-path latency statistics."""
+        with self._lock:
+            report: dict[str, Any] = {
+                "warm_up_ms": (
+                    round(self._warm_up_ms, 1)
+                    if self._warm_up_ms is not None
+                    else None
+                ),
+                "recently_used": self.recently_used,
+            }
+            for path, bucket in self._latency.items():
+                count = bucket["count"]
+                report[f"{path}_count"] = count
+                report[f"{path}_avg_ms"] = (
+                    round(bucket["total_ms"] / count, 1) if count else None
+                )
+        return report
+
+    def close(self) -> None:
+        """Close pooled connections."""
+        self._session.close()
+        self._last_used = None
+
+
+class HuianRateLimited(Exception):
+    """在截止时间前拿不到发送预算."""
+
+    def __init__(self, retry_after: float) -> None:
+        """Initialize the error."""
+        super().__init__(f"Rate limited, retry after {retry_after:.1f}s")
+        self.retry_after = retry_after
+
+
+class HuianTenant:
+    """按 app_key 隔离的推送分区.
+
+    每个分区拥有独立的连接池、限流预算、排队上限、并发上限和统计数据，
+    一个应用凭据的配额耗尽或故障不会拖慢其他应用设备的推送。
+    """
+
+    def __init__(
+        self,
+        app_key: str,
+        master_secret: str,
+        api_url: str = HUIAN_API_URL,
+        timeout: float = HUIAN_TIMEOUT,
+    ) -> None:
+        """Initialize the tenant."""
+        self.app_key = app_key
+        self.api_url = api_url
+        self.connection = HuianConnection(api_url, timeout)
+        self.entry_ids: set[str] = set()
+
+        # 生成认证头（内部处理，不暴露）
+        credentials = f"{app_key}:{master_secret}"
+        encoded = base64.b64encode(credentials.encode()).decode()
+        self._headers = {
+            "Authorization": f"Basic {encoded}",
+            "Content-Type": "application/json",
+        }
+
+        self._semaphore = asyncio.Semaphore(HUIAN_TENANT_CONCURRENCY)
+        self._tokens = float(HUIAN_TENANT_RATE_LIMIT)
+        self._tokens_updated = time.monotonic()
+        self._throttled_until = 0.0
+        self._pending = 0
+        self._in_flight = 0
+        self._metrics = {
+            "sent": 0,
+            "failed": 0,
+            "dropped": 0,
+            "rate_limited": 0,
+            "deadline_exceeded": 0,
+        }
+
+    @staticmethod
+    async def _async_sleep_until(wait: float, deadline: float | None) -> None:
+        """等待 wait 秒；超过截止时间时抛出 HuianRateLimited."""
+        if deadline is not None and time.monotonic() + wait > deadline:
+            raise HuianRateLimited(wait)
+        await asyncio.sleep(wait)
+
+    async def _async_wait_for_budget(self, deadline: float | None) -> None:
+        """等待限流预算（令牌桶）以及 429 之后的暂停期."""
+        while True:
+            now = time.monotonic()
+            if now < self._throttled_until:
+                await self._async_sleep_until(self._throttled_until - now, deadline)
+                continue
+
+            self._tokens = min(
+                float(HUIAN_TENANT_RATE_LIMIT),
+                self._tokens
+                + (now - self._tokens_updated) * HUIAN_TENANT_RATE_LIMIT,
+            )
+            self._tokens_updated = now
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return
+            await self._async_sleep_until(
+                (1 - self._tokens) / HUIAN_TENANT_RATE_LIMIT, deadline
+            )
+
+    def _throttle(self, response: requests.Response) -> None:
+        """极光返回 429 时暂停本分区，直到配额重置."""
+        try:
+            reset = int(response.headers.get("X-Rate-Limit-Reset", ""))
+        except ValueError:
+            reset = HUIAN_TENANT_THROTTLE_DEFAULT
+        self._throttled_until = time.monotonic() + max(reset, 1)
+
+    @property
+    def authorization(self) -> str:
+        """Return the Basic authorization header for this app key."""
+        return self._headers["Authorization"]
+
+    async def _async_acquire_slot(self, deadline: float | None) -> None:
+        """获取并发槽位，最多等到截止时间."""
+        if deadline is None:
+            await self._semaphore.acquire()
+            return
+        try:
+            await asyncio.wait_for(
+                self._semaphore.acquire(), max(deadline - time.monotonic(), 0)
+            )
+        except asyncio.TimeoutError as err:
+            raise HuianRateLimited(1) from err
+
+    async def async_send(
+        self, payload: dict[str, Any], deadline: float | None = None
+    ) -> tuple[requests.Response, float, bool] | None:
+        """排队、限流后发送推送；队列已满时丢弃并返回 None.
+
+        指定 deadline（time.monotonic() 时间）时，若在此之前拿不到并发槽位或
+        限流预算，抛出 HuianRateLimited 而不是继续等待。
+        """
+        if self._pending >= HUIAN_TENANT_QUEUE_SIZE:
+            self._metrics["dropped"] += 1
+            _LOGGER.warning(
+                "Huian push queue full for app_key %s, dropping notification",
+                self.app_key[-6:],
+            )
+            return None
+
+        self._pending += 1
+        try:
+            await self._async_acquire_slot(deadline)
+            try:
+                await self._async_wait_for_budget(deadline)
+                self._in_flight += 1
+                try:
+                    # 默认 executor 即 Home Assistant 的 executor，网关进程中同样可用
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        None, self.connection.post, payload, self._headers
+                    )
+                finally:
+                    self._in_flight -= 1
+            finally:
+                self._semaphore.release()
+        except HuianRateLimited:
+            self._metrics["deadline_exceeded"] += 1
+            raise
+        except requests.exceptions.RequestException:
+            self._metrics["failed"] += 1
+            raise
+        finally:
+            self._pending -= 1
+
+        response = result[0]
+        if response.status_code == 200:
+            self._metrics["sent"] += 1
+        elif response.status_code == 429:
+            self._metrics["rate_limited"] += 1
+            self._throttle(response)
+        else:
+            self._metrics["failed"] += 1
+        return result
+
+    def diagnostics(self) -> dict[str, Any]:
+        """Return the tenant state for diagnostics."""
+        throttled_for = self._throttled_until - time.monotonic()
+        return {
+            "app_key": self.app_key,
+            "upstream": self.api_url,
+            "entries": len(self.entry_ids),
+            "queued": self._pending - self._in_flight,
+            "in_flight": self._in_flight,
+            "throttled_for_s": round(throttled_for, 1) if throttled_for > 0 else 0,
+            "limits": {
+                "concurrency": HUIAN_TENANT_CONCURRENCY,
+                "rate_per_s": HUIAN_TENANT_RATE_LIMIT,
+                "queue_size": HUIAN_TENANT_QUEUE_SIZE,
+            },
+            "metrics": dict(self._metrics),
+            "latency": self.connection.latency_report(),
+        }
+
+
 class HuianNotificationService(BaseNotificationService):
     """Implement the notification service for Huian."""
 
     def __init__(
         self,
         hass: HomeAssistant,
-        app_key: str,
-        master_secret: str,
+        tenant: HuianTenant,
         registration_id: str,
         production: bool = False,
     ) -> None:
         """Initialize the service."""
         self._hass = hass
-        self._app_key = app_key
-        self._master_secret = master_secret
+        self._tenant = tenant
         self._registration_id = registration_id
         self._production = production
 
-        # 生成认证头（内部处理，不暴露）
-        credentials = f"{app_key}:{master_secret}"
-        encoded = base64.b64encode(credentials.encode()).decode()
-        self._auth_header = f"Basic {encoded}"
-
         _LOGGER.info(
             "Huian Notify service initialized for device: %s",
             registration_id[-8:],
@@ -88,48 +642,35 @@ class HuianNotificationService(BaseNotificationService):
 
     async def async_send_message(self, message: str = "", **kwargs: Any) -> None:
         """Send a message to Huian."""
-        title = kwargs.get(ATTR_TITLE, "Home Assistant")
-        data = kwargs.get(ATTR_DATA, {})
-
-        # 从data中获取额外参数
-        badge = data.get("badge", "+1")
-        sound = data.get("sound", "default")
+        # 推送前校验和截断：无效参数直接报错给调用方，不消耗网络和配额
+        title, message, badge, sound = prepare_notification(
+            kwargs.get(ATTR_TITLE, "Home Assistant"),
+            message,
+            kwargs.get(ATTR_DATA),
+        )
 
         # 构建推送payload
-        payload = {
-            "platform": ["ios"],
-            "audience": {"registration_id": [self._registration_id]},
-            "notification": {
-                "ios": {
-                    "alert": {"title": title, "body": message},
-                    "badge": badge,
-                    "sound": sound,
-                }
-            },
-            "options": {"apns_production": self._production},
-        }
-
-        # 发送请求
-        headers = {
-            "Authorization": self._auth_header,
-            "Content-Type": "application/json",
-        }
+        payload = build_payload(
+            [self._registration_id], title, message, badge, sound, self._production
+        )
 
+        # 发送请求（经由该 app_key 的分区排队和限流）
+        # 设置截止时间：分区被 429 暂停时不让服务调用长时间挂起后再迟到送达
         try:
-            response = await self._hass.async_add_executor_job(
-                lambda: requests.post(
-                    HUIAN_API_URL,
-                    json=payload,
-                    headers=headers,
-                    timeout=HUIAN_TIMEOUT,
-                )
+            result = await self._tenant.async_send(
+                payload, time.monotonic() + HUIAN_TENANT_SEND_DEADLINE
             )
+            if result is None:
+                return
+            response, elapsed_ms, warm = result
 
             if response.status_code == 200:
                 result = response.json()
                 _LOGGER.info(
-                    "Huian notification sent successfully: msg_id=%s",
+                    "Huian notification sent successfully: msg_id=%s (%s, %.0f ms)",
                     result.get("msg_id"),
+                    "warm" if warm else "cold",
+                    elapsed_ms,
                 )
             else:
                 _LOGGER.error(
@@ -137,6 +678,8 @@ class HuianNotificationService(BaseNotificationService):
                     response.status_code,
                     response.text,
                 )
+        except HuianRateLimited as err:
+            _LOGGER.error("Huian notification not sent: %s", err)
         except requests.exceptions.RequestException as err:
             _LOGGER.error("Error sending Huian notification: %s", err)
         except Exception as err:  # pylint: disable=broad-except
@@ -0,0 +1,63 @@
+"""Shared helpers: a local stand-in for the JPush push API."""
+from __future__ import annotations
+
+import base64
+from typing import Any
+
+from aiohttp import web
+
+APP_KEY = "test_app_key"
+MASTER_SECRET = "test_master_secret"
+RATE_LIMITED_ID = "rate_limited_device"
+
+
+class JPushStandIn:
+    """Minimal local stand-in for the JPush push API."""
+
+    def __init__(self, credentials: dict[str, str] | None = None) -> None:
+        """Initialize the stand-in with the accepted app_key -> secret pairs."""
+        if credentials is None:
+            credentials = {APP_KEY: MASTER_SECRET}
+        self._authorizations = {
+            "Basic "
+            + base64.b64encode(f"{app_key}:{secret}".encode()).decode()
+            for app_key, secret in credentials.items()
+        }
+        self.pushes: list[dict[str, Any]] = []
+
+    def create_app(self) -> web.Application:
+        """Create the aiohttp application."""
+        app = web.Application()
+        app.router.add_post("/v3/push", self.handle_push)
+        return app
+
+    async def handle_push(self, request: web.Request) -> web.Response:
+        """Accept a push, rejecting bad credentials and rate-limited devices."""
+        if request.headers.get("Authorization") not in self._authorizations:
+            return web.json_response(
+                {"error": {"code": 1004, "message": "Authentication failed"}},
+                status=401,
+            )
+
+        payload = await request.json()
+        self.pushes.append(payload)
+        if RATE_LIMITED_ID in payload["audience"]["registration_id"]:
+            return web.json_response(
+                {"error": {"code": 2002, "message": "Request times exceeds limit"}},
+                status=429,
+                headers={
+                    "X-Rate-Limit-Limit": "600",
+                    "X-Rate-Limit-Remaining": "0",
+                    "X-Rate-Limit-Reset": "30",
+                },
+            )
+        return web.json_response({"sendno": "0", "msg_id": str(len(self.pushes))})
+
+
+async def async_start(app: web.Application) -> tuple[web.AppRunner, str]:
+    """Serve an app on a free local port; return the runner and base URL."""
+    runner = web.AppRunner(app)
+    await runner.setup()
+    await web.TCPSite(runner, "127.0.0.1", 0).start()
+    host, port = runner.addresses[0][:2]
+    return runner, f"http://{host}:{port}"
@@ -0,0 +1,159 @@
+"""End-to-end tests for the push gateway against a local JPush stand-in."""
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiohttp")
+pytest.importorskip("requests")
+
+import requests  # noqa: E402
+
+from custom_components.huian_notify.const import (  # noqa: E402
+    CONF_GATEWAY_URL,
+    HUIAN_GATEWAY_TIMEOUT,
+)
+from custom_components.huian_notify.gateway import HuianGateway  # noqa: E402
+from custom_components.huian_notify.notify import (  # noqa: E402
+    HuianTenant,
+    build_payload,
+    resolve_api_url,
+)
+
+from .common import (  # noqa: E402
+    APP_KEY,
+    MASTER_SECRET,
+    RATE_LIMITED_ID,
+    JPushStandIn,
+    async_start,
+)
+
+
+def _run(test: Callable[[JPushStandIn, str], Awaitable[None]]) -> None:
+    """Run a test against a JPush stand-in with a gateway in front of it."""
+
+    async def _async_run() -> None:
+        stand_in = JPushStandIn()
+        upstream, upstream_url = await async_start(stand_in.create_app())
+
+        gateway = HuianGateway(f"{upstream_url}/v3/push", batch_window=0.2)
+        gateway_runner, gateway_url = await async_start(gateway.create_app())
+        try:
+            await test(stand_in, gateway_url)
+        finally:
+            await gateway_runner.cleanup()
+            await upstream.cleanup()
+
+    asyncio.run(_async_run())
+
+
+def _tenant(gateway_url: str, master_secret: str = MASTER_SECRET) -> HuianTenant:
+    """Return an integration-side partition that forwards through the gateway."""
+    return HuianTenant(
+        APP_KEY,
+        master_secret,
+        resolve_api_url({CONF_GATEWAY_URL: gateway_url}),
+        HUIAN_GATEWAY_TIMEOUT,
+    )
+
+
+def _payload(registration_id: str) -> dict[str, Any]:
+    """Return a push payload for one device."""
+    return build_payload([registration_id], "标题", "消息", "+1", "default", True)
+
+
+def test_identical_pushes_are_batched() -> None:
+    """Identical pushes within the batch window become one upstream request."""
+
+    async def _test(stand_in: JPushStandIn, gateway_url: str) -> None:
+        tenant = _tenant(gateway_url)
+        results = await asyncio.gather(
+            *(tenant.async_send(_payload(f"device_{i}")) for i in range(3))
+        )
+        tenant.connection.close()
+
+        for response, _, _ in results:
+            assert response.status_code == 200
+            assert response.headers["X-Huian-Batch-Size"] == "3"
+        assert len(stand_in.pushes) == 1
+        assert sorted(stand_in.pushes[0]["audience"]["registration_id"]) == [
+            "device_0",
+            "device_1",
+            "device_2",
+        ]
+
+    _run(_test)
+
+
+def test_rate_limit_is_passed_through() -> None:
+    """Upstream 429s reach the client with JPush's X-Rate-Limit-* headers."""
+
+    async def _test(stand_in: JPushStandIn, gateway_url: str) -> None:
+        tenant = _tenant(gateway_url)
+        response, _, _ = await tenant.async_send(_payload(RATE_LIMITED_ID))
+        tenant.connection.close()
+
+        assert response.status_code == 429
+        assert response.headers["X-Rate-Limit-Remaining"] == "0"
+        assert response.headers["X-Rate-Limit-Reset"] == "30"
+        diagnostics = tenant.diagnostics()
+        assert diagnostics["metrics"]["rate_limited"] == 1
+        assert diagnostics["throttled_for_s"] > 0
+
+        # 网关分区已暂停：另一个实例的推送在截止时间内直接得到 429，不会被挂起
+        other = _tenant(gateway_url)
+        response, _, _ = await other.async_send(_payload("device_0"))
+        other.connection.close()
+
+        assert response.status_code == 429
+        assert int(response.headers["X-Rate-Limit-Reset"]) > 0
+        assert len(stand_in.pushes) == 1
+
+    _run(_test)
+
+
+def test_rejected_credentials_do_not_lock_out_others() -> None:
+    """Bad credentials get a 401 without affecting clients with valid ones."""
+
+    async def _test(stand_in: JPushStandIn, gateway_url: str) -> None:
+        wrong = _tenant(gateway_url, "wrong_secret")
+        response, _, _ = await wrong.async_send(_payload("device_0"))
+        wrong.connection.close()
+        assert response.status_code == 401
+
+        tenant = _tenant(gateway_url)
+        response, _, _ = await tenant.async_send(_payload("device_0"))
+        tenant.connection.close()
+        assert response.status_code == 200
+
+        response = await asyncio.to_thread(
+            requests.post,
+            f"{gateway_url}/v3/push",
+            json=_payload("device_0"),
+            headers={"Authorization": "Bearer not-basic"},
+            timeout=5,
+        )
+        assert response.status_code == 401
+        assert len(stand_in.pushes) == 1
+
+    _run(_test)
+
+
+@pytest.mark.parametrize(
+    "gateway_url",
+    [
+        "http://127.0.0.1:8765",
+        "http://127.0.0.1:8765/",
+        "http://127.0.0.1:8765/v3/push",
+        "http://127.0.0.1:8765/v3/push/",
+    ],
+)
+def test_gateway_url_resolves_to_push_endpoint(gateway_url: str) -> None:
+    """A base URL or the full endpoint both resolve to one /v3/push path."""
+    assert (
+        resolve_api_url({CONF_GATEWAY_URL: gateway_url})
+        == "http://127.0.0.1:8765/v3/push"
+    )
@@ -0,0 +1,121 @@
+"""Tests for pre-flight notification validation and truncation."""
+from __future__ import annotations
+
+import json
+from typing import Any
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from homeassistant.exceptions import ServiceValidationError  # noqa: E402
+
+from custom_components.huian_notify.const import (  # noqa: E402
+    HUIAN_APNS_PAYLOAD_LIMIT,
+    HUIAN_APNS_PAYLOAD_RESERVED,
+    HUIAN_TRUNCATION_MARK,
+)
+from custom_components.huian_notify.notify import prepare_notification  # noqa: E402
+
+BUDGET = HUIAN_APNS_PAYLOAD_LIMIT - HUIAN_APNS_PAYLOAD_RESERVED
+
+
+def _aps_size(title: str, message: str, badge: str, sound: str) -> int:
+    """Return the UTF-8 size of the aps structure the device receives."""
+    aps = {
+        "aps": {
+            "alert": {"title": title, "body": message},
+            "badge": badge,
+            "sound": sound,
+        }
+    }
+    return len(json.dumps(aps, ensure_ascii=False, separators=(",", ":")).encode())
+
+
+def _truncate(message: str, data: dict[str, Any] | None = None) -> str:
+    """Prepare a notification and check the result fits the payload budget."""
+    result = prepare_notification("标题", message, data)
+    assert _aps_size(*result) <= BUDGET
+    body = result[1]
+    assert body.endswith(HUIAN_TRUNCATION_MARK)
+    return body[: -len(HUIAN_TRUNCATION_MARK)]
+
+
+@pytest.mark.parametrize("message", ["x\n" * 1500, '"' * 3000, "\\" * 5000])
+def test_escaped_body_is_sized_by_escaped_length(message: str) -> None:
+    """Bodies that grow under JSON escaping still fit and use most of the budget."""
+    body = _truncate(message)
+    assert message.startswith(body)
+    assert _aps_size("标题", body + HUIAN_TRUNCATION_MARK, "+1", "default") > BUDGET - 10
+
+
+@pytest.mark.parametrize("message", ["推送消息" * 1000, "😀" * 2000, "中文😀" * 1000])
+def test_multibyte_body_fits_budget(message: str) -> None:
+    """Chinese and emoji bodies are cut on character boundaries within budget."""
+    body = _truncate(message)
+    assert message.startswith(body)
+
+
+def test_flag_emoji_are_not_split() -> None:
+    """A truncated run of flags never ends in a lone regional indicator."""
+    message = "a" + "🇨🇳" * 1500
+    body = _truncate(message)
+    assert (len(body) - 1) % 2 == 0
+    assert body[1:] == "🇨🇳" * ((len(body) - 1) // 2)
+
+
+@pytest.mark.parametrize("sequence", ["👨‍👩‍👧", "👍🏽", "❤️", "é"])
+def test_emoji_sequences_are_not_split(sequence: str) -> None:
+    """ZWJ sequences, modifiers and combining marks stay with their base."""
+    body = _truncate(sequence * 2000)
+    assert body == sequence * (len(body) // len(sequence))
+
+
+def test_short_message_is_unchanged() -> None:
+    """A notification within budget is returned as-is with defaults filled in."""
+    assert prepare_notification("标题", "消息", None) == ("标题", "消息", "+1", "default")
+
+
+def test_title_too_long_is_rejected() -> None:
+    """A title that leaves no room for the body is rejected, not truncated."""
+    with pytest.raises(ServiceValidationError, match="title is too long"):
+        prepare_notification("t" * 3900, "消息", None)
+
+
+@pytest.mark.parametrize(
+    ("badge", "expected"), [(5, 5), ("5", "5"), (" 05 ", "5"), ("+01", "+1"), ("-3", "-3")]
+)
+def test_badge_is_normalised(badge: Any, expected: Any) -> None:
+    """Accepted badges are returned in canonical form."""
+    assert prepare_notification("t", "m", {"badge": badge})[2] == expected
+
+
+@pytest.mark.parametrize(
+    "data",
+    [
+        {"badge": "x"},
+        {"badge": -1},
+        {"badge": True},
+        {"badge": "١٢"},
+        {"badge": 100000},
+        {"badge": "+100000"},
+        {"sound": "alert.mp3"},
+        {"sound": "../alert.caf"},
+        {"sound": 1},
+        {"url": "https://example.com"},
+        "badge",
+    ],
+)
+def test_invalid_data_is_rejected(data: Any) -> None:
+    """Bad badge, bad sound and unknown keys fail before anything is sent."""
+    with pytest.raises(ServiceValidationError):
+        prepare_notification("t", "m", data)
+
+
+@pytest.mark.parametrize(
+    ("title", "message"), [("t", "\ud800" * 10), ("\udfff", "m")]
+)
+def test_lone_surrogates_are_rejected(title: str, message: str) -> None:
+    """Text that cannot be UTF-8 encoded raises a validation error."""
+    with pytest.raises(ServiceValidationError, match="cannot be encoded"):
+        prepare_notification(title, message, None)
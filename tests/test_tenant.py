@@ -0,0 +1,71 @@
+"""Tests for per-app-key push partitions against a local JPush stand-in."""
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+pytest.importorskip("homeassistant")
+pytest.importorskip("aiohttp")
+pytest.importorskip("requests")
+
+from custom_components.huian_notify.notify import (  # noqa: E402
+    HuianRateLimited,
+    HuianTenant,
+    build_payload,
+)
+
+from .common import RATE_LIMITED_ID, JPushStandIn, async_start  # noqa: E402
+
+APP_KEY_A = "app_key_a"
+APP_KEY_B = "app_key_b"
+SECRET = "secret"
+
+
+def _payload(registration_id: str) -> dict[str, Any]:
+    """Return a push payload for one device."""
+    return build_payload([registration_id], "标题", "消息", "+1", "default", True)
+
+
+def test_throttled_tenant_does_not_delay_others() -> None:
+    """A 429 pauses only the affected app key; other partitions send at once."""
+
+    async def _async_test() -> None:
+        stand_in = JPushStandIn({APP_KEY_A: SECRET, APP_KEY_B: SECRET})
+        runner, url = await async_start(stand_in.create_app())
+        tenant_a = HuianTenant(APP_KEY_A, SECRET, f"{url}/v3/push")
+        tenant_b = HuianTenant(APP_KEY_B, SECRET, f"{url}/v3/push")
+        try:
+            response, _, _ = await tenant_a.async_send(_payload(RATE_LIMITED_ID))
+            assert response.status_code == 429
+            assert tenant_a.diagnostics()["throttled_for_s"] > 0
+
+            # A 在截止时间内拿不到预算，立即失败而不是睡到配额重置
+            start = time.monotonic()
+            with pytest.raises(HuianRateLimited):
+                await tenant_a.async_send(
+                    _payload("device_a"), time.monotonic() + 1
+                )
+            assert time.monotonic() - start < 1
+            assert tenant_a.diagnostics()["metrics"]["deadline_exceeded"] == 1
+
+            # B 不受 A 的暂停影响
+            start = time.monotonic()
+            response, _, _ = await tenant_b.async_send(
+                _payload("device_b"), time.monotonic() + 1
+            )
+            assert response.status_code == 200
+            assert time.monotonic() - start < 1
+            assert tenant_b.diagnostics()["metrics"]["sent"] == 1
+            assert [push["audience"]["registration_id"] for push in stand_in.pushes] == [
+                [RATE_LIMITED_ID],
+                ["device_b"],
+            ]
+        finally:
+            tenant_a.connection.close()
+            tenant_b.connection.close()
+            await runner.cleanup()
+
+    asyncio.run(_async_test())